@@ -6,18 +6,460 @@ Extracts audio from video files and generates SRT subtitle files using VOSK spee
 import os
 import sys
 import json
+import functools
+import struct
 import subprocess
 import tempfile
+import threading
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, InvalidStateError, ProcessPoolExecutor, wait
+from multiprocessing import freeze_support, get_context
 from pathlib import Path
 import vosk
 import wave
 import subprocess
 import argparse
-from datetime import timedelta
+
+try:
+    import webrtcvad
+except ImportError:  # Optional: without it silence is not skipped and one core is used
+    webrtcvad = None
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # Optional: faster decoding of VOSK's JSON results
+    json_loads = json.loads
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # Optional: phrase grouping then runs as plain Python
+    np = None
+    njit = None
+
+
+# Project layout, resolved once at import
+_SCRIPT_DIR = Path(__file__).resolve().parent
+_FFMPEG_PATH = _SCRIPT_DIR / 'ffmpeg.exe'
+_FFPROBE_PATH = _SCRIPT_DIR / 'ffprobe.exe'
+_MODEL_DIR = _SCRIPT_DIR / 'models'
+_VIDEO_DIR = _SCRIPT_DIR / 'video'
+_OUTPUT_DIR = _SCRIPT_DIR / 'output'
+_VIDEO_EXTS = frozenset({'.mp4', '.avi', '.mov', '.mkv', '.webm'})
+
+# Raw PCM layout fed to VOSK: 16 kHz, mono, signed 16-bit little-endian
+SAMPLE_RATE = 16000
+CHUNK_FRAMES = 8000  # Frames per AcceptWaveform call (0.5 s)
+CHUNK_BYTES = CHUNK_FRAMES * 2
+
+# Buffered SRT entries written out once this many are pending (~1 MiB of text)
+SRT_FLUSH_ENTRIES = 16384
+
+# One SRT block: index, start and end as HH:MM:SS,mmm, text
+_SRT_ENTRY = "%d\n%02d:%02d:%02d,%03d --> %02d:%02d:%02d,%03d\n%s\n\n"
+
+# Default cap on recognizer processes; each one loads its own copy of the model
+DEFAULT_MAX_WORKERS = 4
+
+# Recognizer pools kept running, one per model path, so switching back to a
+# recent model doesn't make every worker load it again
+WORKER_POOL_CACHE_SIZE = 2
+
+# VOSK models kept loaded per process. This is the only model cache (the GUI
+# relies on it when switching languages), so it bounds the RAM held by models
+# and their idle recognizers
+MODEL_CACHE_SIZE = 4
+
+# Sample rates webrtcvad can classify
+VAD_SAMPLE_RATES = (8000, 16000, 32000, 48000)
+
+# How a VOSK result with no recognized speech ends
+_EMPTY_RESULT_TAIL = '"text" : ""\n}'
+
+
+def _new_recognizer(model, sample_rate):
+    """Create a recognizer producing word timestamps and nothing we don't read."""
+    rec = vosk.KaldiRecognizer(model, sample_rate)
+    rec.SetWords(True)  # Enable word-level timestamps
+    rec.SetMaxAlternatives(0)
+    # Partial results are never read; older VOSK builds lack this switch
+    if hasattr(rec, 'SetPartialWords'):
+        rec.SetPartialWords(False)
+    return rec
+
+
+def _parse_result(raw):
+    """
+    Decode a VOSK Result()/FinalResult() string, or return None if it holds no text.
+    
+    VOSK always writes "text" as the last key, so a silent segment can be
+    recognized from the tail of the string and dropped without decoding.
+    """
+    if raw.endswith(_EMPTY_RESULT_TAIL):
+        return None
+    result = json_loads(raw)
+    return result if result.get('text') else None
+
+
+@functools.lru_cache(maxsize=MODEL_CACHE_SIZE)
+def _get_model(model_path):
+    """Load a VOSK model, reusing it for every later request in this process."""
+    return vosk.Model(model_path)
+
+
+# The idle recognizer per model and sample rate, reused within a process (a
+# process only runs one at a time). Held weakly by the model, so it goes as
+# soon as _get_model's cache drops the model
+_idle_recognizers = weakref.WeakKeyDictionary()
+
+
+def _acquire_recognizer(model, sample_rate):
+    """Take the model's idle recognizer for this sample rate, or create one."""
+    rec = _idle_recognizers.get(model, {}).pop(sample_rate, None)
+    if rec is None:
+        rec = _new_recognizer(model, sample_rate)
+    return rec
+
+
+def _release_recognizer(model, sample_rate, rec):
+    """Reset a recognizer and keep it as the model's idle one for the next segment."""
+    rec.Reset()
+    _idle_recognizers.setdefault(model, {})[sample_rate] = rec
+
+
+def _init_worker(model_path):
+    """Load the VOSK model when a worker process starts, not on its first task."""
+    _get_model(model_path)
+
+
+# Running recognizer pools per model path as (executor, workers), most recently used last
+_worker_pools = OrderedDict()
+_worker_pools_lock = threading.Lock()
+
+
+def _get_worker_pool(model_path, workers):
+    """Return the recognizer pool for model_path, (re)starting it for this worker count."""
+    with _worker_pools_lock:
+        entry = _worker_pools.pop(model_path, None)
+        if entry is not None and entry[1] != workers:
+            entry[0].shutdown(wait=False, cancel_futures=True)
+            entry = None
+        if entry is None:
+            # Spawn on every platform: forking a process that runs Tk and
+            # ffmpeg reader threads isn't safe
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(model_path,)
+            )
+            entry = (executor, workers)
+        _worker_pools[model_path] = entry
+        while len(_worker_pools) > WORKER_POOL_CACHE_SIZE:
+            _, (executor, _) = _worker_pools.popitem(last=False)
+            executor.shutdown(wait=False, cancel_futures=True)
+        return entry[0]
+
+
+def _shutdown_worker_pool(model_path):
+    """Stop the recognizer pool for model_path, if one is running."""
+    with _worker_pools_lock:
+        entry = _worker_pools.pop(model_path, None)
+    if entry is not None:
+        entry[0].shutdown(wait=False, cancel_futures=True)
+
+
+def _transcribe_segments(model_path, segments, sample_rate):
+    """
+    Recognize a batch of voiced audio segments, normally in a worker process.
+    
+    Args:
+        model_path (str): Path to the VOSK model directory
+        segments (list): (offset_seconds, pcm_bytes) tuples of 16-bit mono PCM
+        sample_rate (int): Sample rate of the PCM
+    
+    Returns:
+        list: Transcription segments with timestamps relative to the full audio
+    """
+    model = _get_model(model_path)
+    results = []
+    
+    for offset, pcm in segments:
+        # Segments are not contiguous, so each one starts from a reset recognizer
+        rec = _acquire_recognizer(model, sample_rate)
+        segment_results = []
+        
+        for i in range(0, len(pcm), CHUNK_BYTES):
+            if rec.AcceptWaveform(pcm[i:i + CHUNK_BYTES]):
+                result = _parse_result(rec.Result())
+                if result:
+                    segment_results.append(result)
+        
+        final_result = _parse_result(rec.FinalResult())
+        if final_result:
+            segment_results.append(final_result)
+        _release_recognizer(model, sample_rate, rec)
+        
+        # Shift word timestamps from segment time to file time
+        for result in segment_results:
+            for word in result.get('result', ()):
+                word['start'] += offset
+                word['end'] += offset
+        
+        results.extend(segment_results)
+    
+    return results
+
+
+def _frame_energy(frame):
+    """Sum of squared samples in a frame of 16-bit little-endian PCM."""
+    samples = struct.unpack(f'<{len(frame) // 2}h', frame[:len(frame) // 2 * 2])
+    return sum(s * s for s in samples)
+
+
+def _voiced_segments(readinto, sample_rate, frame_ms=30, padding_ms=300, max_seconds=30.0):
+    """
+    Yield the voiced stretches of a raw PCM stream, dropping the silence between them.
+    
+    Frames are classified with webrtcvad. A segment opens once 90% of the frames
+    in a padding_ms window are voiced and closes once 90% are unvoiced, so each
+    segment keeps about padding_ms of context on both sides. A segment that runs
+    past max_seconds is split at the quietest frame of the last padding_ms, so
+    the cut lands in a pause between words where there is one.
+    
+    Args:
+        readinto (callable): readinto(buf) filling buf with 16-bit mono PCM, returning the byte count
+        sample_rate (int): Sample rate of the PCM (one of VAD_SAMPLE_RATES)
+        frame_ms (int): VAD frame length (10, 20 or 30 ms)
+        padding_ms (int): Length of the voiced/unvoiced decision window
+        max_seconds (float): Longest segment before it is cut even without a pause
+    
+    Yields:
+        tuple: (offset_seconds, pcm_bytes) for each voiced segment
+    """
+    vad = webrtcvad.Vad(2)
+    frame_bytes = sample_rate * frame_ms // 1000 * 2
+    max_bytes = int(max_seconds * sample_rate) * 2
+    bytes_per_second = sample_rate * 2
+    
+    buf = bytearray(frame_bytes)
+    view = memoryview(buf)
+    ring = deque(maxlen=padding_ms // frame_ms)  # (frame, is_speech) for the recent window
+    threshold = 0.9 * ring.maxlen
+    segment = bytearray()
+    segment_start = 0
+    position = 0
+    triggered = False
+    
+    while True:
+        n = readinto(buf)
+        if not n:
+            break
+        frame = bytes(view[:n])
+        is_speech = n == frame_bytes and vad.is_speech(frame, sample_rate)
+        position += n
+        ring.append((frame, is_speech))
+        
+        if not triggered:
+            if sum(voiced for _, voiced in ring) > threshold:
+                # Speech started; keep the window that led up to it
+                triggered = True
+                segment_start = position - sum(len(f) for f, _ in ring)
+                for f, _ in ring:
+                    segment += f
+                ring.clear()
+        else:
+            segment += frame
+            if len(ring) - sum(voiced for _, voiced in ring) > threshold:
+                yield segment_start / bytes_per_second, bytes(segment)
+                segment = bytearray()
+                ring.clear()
+                triggered = False
+            elif len(segment) >= max_bytes:
+                # Cut after the least voiced frame in the window; the frames
+                # after it open the next segment
+                frames = list(ring)
+                quietest = min(range(len(frames)),
+                               key=lambda i: (frames[i][1], _frame_energy(frames[i][0])))
+                tail = sum(len(f) for f, _ in frames[quietest + 1:])
+                cut = len(segment) - tail
+                yield segment_start / bytes_per_second, bytes(segment[:cut])
+                del segment[:cut]
+                segment_start = position - tail
+    
+    if segment:
+        yield segment_start / bytes_per_second, bytes(segment)
+
+
+def _batch_segments(segments, sample_rate, target_seconds=30.0):
+    """
+    Group consecutive voiced segments into work items of about target_seconds of audio.
+    
+    Yields:
+        list: (offset_seconds, pcm_bytes) tuples
+    """
+    target_bytes = int(target_seconds * sample_rate) * 2
+    batch = []
+    batch_bytes = 0
+    
+    for segment in segments:
+        batch.append(segment)
+        batch_bytes += len(segment[1])
+        if batch_bytes >= target_bytes:
+            yield batch
+            batch = []
+            batch_bytes = 0
+    
+    if batch:
+        yield batch
+
+
+def _ffmpeg_audio_cmd(video_path, *output_args):
+    """
+    Build the ffmpeg command that decodes a video's first audio track for VOSK.
+    
+    Args:
+        video_path (str): Path to input video file
+        *output_args (str): Output format and target, e.g. '-f', 's16le', 'pipe:1'
+    
+    Returns:
+        list: ffmpeg argument list using the local ffmpeg.exe
+    """
+    return [
+        str(_FFMPEG_PATH),
+        '-threads', '0',          # Decode on all cores
+        '-i', video_path,
+        '-map', '0:a:0',          # Only demux/decode the first audio stream
+        '-vn',
+        '-af', f'aresample={SAMPLE_RATE}',
+        '-ac', '1',
+        '-c:a', 'pcm_s16le',
+        *output_args
+    ]
+
+
+def _jit(signature, **options):
+    """
+    Compile a function eagerly for signature with Numba when it is installed.
+    
+    Giving the signature up front compiles at import (or loads from the on-disk
+    cache) instead of on the first call. Without Numba the function is left as
+    plain Python.
+    """
+    def decorate(func):
+        if njit is None:
+            return func
+        return njit(signature, cache=True, boundscheck=False, error_model='numpy', **options)(func)
+    return decorate
+
+
+@_jit('int64(float64[:], float64[:], int64[:], int64, float64)', fastmath=True)
+def _group_phrases(starts, ends, splits, max_words, max_duration):
+    """
+    Find where to break a run of timed words into subtitle phrases.
+    
+    A phrase ends once it holds max_words words, spans max_duration seconds,
+    or reaches the last word.
+    
+    Args:
+        starts: Word start times in seconds
+        ends: Word end times in seconds
+        splits: Output buffer, at least as long as starts
+        max_words (int): Maximum words per phrase
+        max_duration (float): Maximum phrase length in seconds
+    
+    Returns:
+        int: Number of phrases; splits[:n] holds each phrase's exclusive end index
+    """
+    n = len(starts)
+    n_splits = 0
+    count = 0
+    phrase_start = 0.0
+    
+    for i in range(n):
+        if count == 0:
+            phrase_start = starts[i]
+        count += 1
+        
+        if count >= max_words or ends[i] - phrase_start >= max_duration or i == n - 1:
+            splits[n_splits] = i + 1
+            n_splits += 1
+            count = 0
+    
+    return n_splits
+
+
+@_jit('void(float64[:], int64[:])')
+def _ms_from_seconds(seconds, out):
+    """Round times in seconds to whole milliseconds, writing them into out."""
+    for i in range(len(seconds)):
+        out[i] = int(seconds[i] * 1000 + 0.5)
+
+
+def _render_srt(entries, first_index):
+    """
+    Render subtitle entries as SRT text in one pass.
+    
+    Each entry is formatted with a single %-template from integer
+    milliseconds, rather than formatting each timestamp separately.
+    
+    Args:
+        entries (list): (start_ms, end_ms, text) tuples
+        first_index (int): Subtitle number of the first entry
+    
+    Returns:
+        str: SRT blocks for all entries
+    """
+    parts = []
+    index = first_index
+    for start, end, text in entries:
+        parts.append(_SRT_ENTRY % (
+            index,
+            start // 3600_000, start // 60_000 % 60, start // 1000 % 60, start % 1000,
+            end // 3600_000, end // 60_000 % 60, end // 1000 % 60, end % 1000,
+            text
+        ))
+        index += 1
+    return ''.join(parts)
+
+
+def _open_wav_data(wav_path):
+    """
+    Open a WAV file positioned at the first byte of its sample data.
+    
+    Args:
+        wav_path (str): Path to WAV file
+    
+    Returns:
+        tuple: (binary file object, size of the data chunk in bytes)
+    """
+    f = open(wav_path, 'rb')
+    try:
+        header = f.read(12)
+        if header[:4] != b'RIFF' or header[8:12] != b'WAVE':
+            raise ValueError(f"Not a WAV file: {wav_path}")
+        
+        # Walk the RIFF chunks; ffmpeg may write LIST metadata before 'data'
+        while True:
+            chunk_header = f.read(8)
+            if len(chunk_header) < 8:
+                raise ValueError(f"No audio data found in WAV file: {wav_path}")
+            chunk_id, chunk_size = struct.unpack('<4sI', chunk_header)
+            if chunk_id == b'data':
+                return f, chunk_size
+            f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+    except Exception:
+        f.close()
+        raise
+
+
+class GenerationCancelled(Exception):
+    """Raised by process_video() when SubtitleGenerator.cancel() stopped the run."""
 
 
 class SubtitleGenerator:
-    def __init__(self, vosk_model_path=None, language='en', custom_model=False):
+    def __init__(self, vosk_model_path=None, language='en', custom_model=False, workers=None):
         """
         Initialize the subtitle generator.
         
@@ -25,30 +467,102 @@ class SubtitleGenerator:
             vosk_model_path (str): Path to the VOSK model directory
             language (str): Language code ('en' for English, 'hi' for Hindi)
             custom_model (bool): Whether using a custom model path
+            workers (int): Recognizer processes for transcription (defaults to the
+                CPU count, capped at DEFAULT_MAX_WORKERS)
         """
         self.language = language
         self.custom_model = custom_model
+        self.workers = workers
+        self._proc = None  # ffmpeg process of the current run, for cancel()
+        self._cancel_signal = Future()  # Resolved by cancel(); replaced once the run stops
         
         if custom_model and vosk_model_path:
             self.vosk_model_path = vosk_model_path
         else:
             self.vosk_model_path = vosk_model_path or self._get_default_model_path()
         
-        self.model = None
+        self._duration = None  # Seconds of audio in the video being processed, if known
         self._load_vosk_model()
     
+    @property
+    def model(self):
+        """The VOSK model in this process (loaded on first use)."""
+        return _get_model(self.vosk_model_path)
+    
+    @property
+    def workers(self):
+        """Number of recognizer processes used for transcription."""
+        return self._workers
+    
+    @workers.setter
+    def workers(self, value):
+        # None picks the default; a running pool is resized on its next use
+        self._workers = value or min(os.cpu_count() or 1, DEFAULT_MAX_WORKERS)
+    
+    def _uses_worker_pool(self):
+        """Whether transcription runs in the recognizer pool rather than this process."""
+        return webrtcvad is not None and self.workers > 1
+    
+    def _get_executor(self):
+        """Return the recognizer pool for this model, shared with other generators using it."""
+        return _get_worker_pool(self.vosk_model_path, self.workers)
+    
+    def close(self):
+        """Shut down the recognizer processes for this model. The generator can still be used afterwards."""
+        _shutdown_worker_pool(self.vosk_model_path)
+    
+    @staticmethod
+    def shutdown_worker_pools():
+        """Shut down the recognizer processes of every model, e.g. on exit."""
+        with _worker_pools_lock:
+            entries = list(_worker_pools.values())
+            _worker_pools.clear()
+        for executor, _ in entries:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def cancel(self):
+        """
+        Stop the process_video() call running in another thread.
+        
+        ffmpeg is terminated and the recognizer pool shut down, so the run stops
+        without waiting for the next chunk; process_video() then raises
+        GenerationCancelled. Safe to call from any thread. Called with no run in
+        progress, it stops the next one.
+        """
+        try:
+            self._cancel_signal.set_result(None)
+        except InvalidStateError:
+            return  # Already cancelling
+        proc = self._proc
+        if proc is not None and proc.poll() is None:
+            proc.terminate()
+        self.close()
+    
+    def _check_cancelled(self):
+        if self._cancel_signal.done():
+            raise GenerationCancelled("Subtitle generation cancelled")
+    
+    def _start_ffmpeg(self, ffmpeg_cmd, **popen_args):
+        """Launch ffmpeg as the current run's process, so cancel() can terminate it."""
+        try:
+            proc = self._proc = subprocess.Popen(ffmpeg_cmd, **popen_args)
+        except FileNotFoundError:
+            raise RuntimeError("FFmpeg is missing. Make sure ffmpeg.exe is in the same folder as this script.")
+        
+        # cancel() may have run before there was a process to terminate
+        if self._cancel_signal.done():
+            proc.terminate()
+        return proc
+    
     def _get_default_model_path(self):
         """
         Get default VOSK model path based on your project structure.
         """
-        # Get the directory where this script is located (SRT folder)
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        
         # Define model paths based on your structure
         if self.language.lower() == 'hi':
-            model_path = os.path.join(script_dir, 'models', 'vosk-model-small-hi-0.22')
+            model_path = str(_MODEL_DIR / 'vosk-model-small-hi-0.22')
         else:  # Default to English
-            model_path = os.path.join(script_dir, 'models', 'vosk-model-small-en-us-0.15')
+            model_path = str(_MODEL_DIR / 'vosk-model-small-en-us-0.15')
         
         return model_path
     
@@ -62,8 +576,15 @@ class SubtitleGenerator:
                 "3. Set the model path in the script or pass it as argument"
             )
         
+        if self._uses_worker_pool():
+            # Only the workers need the model: start them loading it now and
+            # keep no copy in this process
+            print(f"Loading VOSK model from: {self.vosk_model_path} on {self.workers} workers")
+            self._get_executor()
+            return
+        
         print(f"Loading VOSK model from: {self.vosk_model_path}")
-        self.model = vosk.Model(self.vosk_model_path)
+        _get_model(self.vosk_model_path)
         print("VOSK model loaded successfully")
     
     def extract_audio(self, video_path, output_audio_path=None, progress_callback=None):
@@ -71,11 +592,9 @@ class SubtitleGenerator:
             raise FileNotFoundError(f"Video file not found: {video_path}")
         
         if output_audio_path is None:
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            output_dir = os.path.join(script_dir, 'output')
-            os.makedirs(output_dir, exist_ok=True)
+            _OUTPUT_DIR.mkdir(exist_ok=True)
             video_name = Path(video_path).stem
-            output_audio_path = os.path.join(output_dir, f"{video_name}_extracted.wav")
+            output_audio_path = str(_OUTPUT_DIR / f"{video_name}_extracted.wav")
         
         print(f"Extracting audio from: {video_path}")
         print(f"Output audio file: {output_audio_path}")
@@ -83,97 +602,258 @@ class SubtitleGenerator:
         if progress_callback:
             progress_callback("Extracting audio from video...")
         
-        # Use local ffmpeg.exe from project directory
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        ffmpeg_path = os.path.join(script_dir, 'ffmpeg.exe')
-
-        ffmpeg_cmd = [
-            ffmpeg_path,
-            '-i', video_path,
-            '-vn',
-            '-acodec', 'pcm_s16le',
-            '-ar', '16000',
-            '-ac', '1',
-            '-y',
-            output_audio_path
-        ]
+        ffmpeg_cmd = _ffmpeg_audio_cmd(video_path, '-f', 'wav', '-y', output_audio_path)
         
-        try:
-            result = subprocess.run(
-                ffmpeg_cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            print("Audio extraction completed successfully")
-            return output_audio_path
-
-        except subprocess.CalledProcessError as e:
-            print(f"FFmpeg error: {e.stderr}")
-            raise RuntimeError(f"Failed to extract audio: {e}")
-        except FileNotFoundError:
-            raise RuntimeError("FFmpeg is missing. Make sure ffmpeg.exe is in the same folder as this script.")
+        # stdout is unused; stderr stays raw bytes unless we need to show it.
+        # Popen rather than run() so cancel() can terminate it meanwhile
+        proc = self._start_ffmpeg(
+            ffmpeg_cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
+        )
+        _, stderr = proc.communicate()
+        
+        if proc.returncode != 0:
+            self._check_cancelled()
+            print(f"FFmpeg error: {stderr.decode('utf-8', 'replace')}")
+            raise RuntimeError(f"Failed to extract audio: ffmpeg exited with code {proc.returncode}")
+        
+        print("Audio extraction completed successfully")
+        return output_audio_path
 
     
-    def transcribe_audio(self, audio_path, progress_callback=None):
+    def open_audio_stream(self, video_path, progress_callback=None):
         """
-        Transcribe audio file using VOSK speech recognition.
+        Launch ffmpeg decoding the video's audio track straight to stdout.
         
         Args:
-            audio_path (str): Path to audio file
+            video_path (str): Path to input video file
             progress_callback (callable): Callback for progress updates
         
         Returns:
-            list: List of transcription segments with timestamps
+            subprocess.Popen: ffmpeg process streaming 16 kHz mono s16le PCM on stdout
+        """
+        if not os.path.exists(video_path):
+            raise FileNotFoundError(f"Video file not found: {video_path}")
+        
+        print(f"Streaming audio from: {video_path}")
+        
+        if progress_callback:
+            progress_callback("Extracting audio from video...")
+        
+        ffmpeg_cmd = _ffmpeg_audio_cmd(video_path, '-f', 's16le', 'pipe:1')
+        
+        return self._start_ffmpeg(
+            ffmpeg_cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=10**7
+        )
+    
+    def _probe_duration(self, video_path):
+        """
+        Read a video's duration with ffprobe.
+        
+        Args:
+            video_path (str): Path to input video file
+        
+        Returns:
+            float: Duration in seconds, or None if ffprobe is unavailable or fails
+        """
+        ffprobe_cmd = [
+            str(_FFPROBE_PATH),
+            '-v', 'error',
+            '-show_entries', 'format=duration',
+            '-of', 'csv=p=0',
+            video_path
+        ]
+        
+        try:
+            result = subprocess.run(ffprobe_cmd, capture_output=True, text=True, check=True)
+            return float(result.stdout.strip())
+        except (OSError, subprocess.CalledProcessError, ValueError):
+            print("Warning: Could not read video duration; progress will be shown in seconds")
+            return None
+    
+    def transcribe_audio(self, audio_source, progress_callback=None, duration=None, progress_fraction=False):
+        """
+        Transcribe audio using VOSK speech recognition.
+        
+        Silence is detected with webrtcvad and skipped; the voiced segments are
+        grouped into ~30s batches and recognized on several worker processes at
+        once. Without webrtcvad a single recognizer runs over the whole audio.
+        
+        Args:
+            audio_source (str | subprocess.Popen): Path to a WAV file, or an ffmpeg
+                process from open_audio_stream() whose stdout carries raw PCM
+            progress_callback (callable): Callback for progress updates
+            duration (float): Length of streamed audio in seconds, used for percent progress
+            progress_fraction (bool): Also pass the fraction transcribed to
+                progress_callback (see process_video())
+        
+        Yields:
+            dict: Transcription segments with timestamps, in order, as they are recognized
         """
-        print(f"Transcribing audio: {audio_path}")
+        proc = audio_source if isinstance(audio_source, subprocess.Popen) else None
+        raw = None
+        
+        if proc:
+            print("Transcribing audio stream...")
+            readinto = proc.stdout.readinto
+            sample_rate = SAMPLE_RATE
+            sample_width = 2
+            # 16 kHz x 2 bytes per sample
+            total_bytes = int(duration * SAMPLE_RATE * 2) if duration else None
+        else:
+            print(f"Transcribing audio: {audio_source}")
+            
+            # Read the format from the header, then stream the samples ourselves
+            with wave.open(audio_source, 'rb') as wf:
+                # Check audio format
+                if wf.getnchannels() != 1 or wf.getsampwidth() != 2 or wf.getcomptype() != 'NONE':
+                    print("Warning: Audio format might not be optimal for VOSK")
+                
+                sample_rate = wf.getframerate()
+                sample_width = wf.getnchannels() * wf.getsampwidth()
+            
+            raw, total_bytes = _open_wav_data(audio_source)
+            remaining = total_bytes
+            
+            def readinto(buf):
+                nonlocal remaining
+                if remaining < len(buf):
+                    buf = memoryview(buf)[:remaining]
+                n = raw.readinto(buf)
+                remaining -= n
+                return n
         
         if progress_callback:
             progress_callback("Transcribing audio...")
+            if not progress_fraction:
+                # The transcription loops report (message, fraction); plain
+                # callbacks only take the message
+                report = progress_callback
+                progress_callback = lambda message, fraction: report(message)
         
-        # Open audio file
-        wf = wave.open(audio_path, 'rb')
+        can_use_vad = (
+            webrtcvad is not None
+            and sample_width == 2
+            and sample_rate in VAD_SAMPLE_RATES
+        )
         
-        # Check audio format
-        if wf.getnchannels() != 1 or wf.getsampwidth() != 2 or wf.getcomptype() != 'NONE':
-            print("Warning: Audio format might not be optimal for VOSK")
+        if can_use_vad:
+            results = self._transcribe_voiced(readinto, sample_rate, total_bytes, progress_callback)
+        else:
+            results = self._transcribe_sequential(readinto, sample_rate, total_bytes, sample_width, progress_callback)
         
-        # Initialize VOSK recognizer
-        rec = vosk.KaldiRecognizer(self.model, wf.getframerate())
-        rec.SetWords(True)  # Enable word-level timestamps
+        segment_count = 0
+        try:
+            for result in results:
+                segment_count += 1
+                yield result
+        finally:
+            if proc:
+                proc.stdout.close()
+                returncode = proc.wait()
+            else:
+                raw.close()
         
-        results = []
+        if proc and returncode != 0:
+            raise RuntimeError(f"Failed to extract audio: ffmpeg exited with code {returncode}")
+        
+        print(f"Transcription completed. Found {segment_count} segments.")
+    
+    def _transcribe_sequential(self, readinto, sample_rate, total_bytes, sample_width, progress_callback=None):
+        """Run a single recognizer over the whole audio stream, yielding segments."""
+        # Initialize VOSK recognizer
+        rec = _new_recognizer(self.model, sample_rate)
         
         print("Processing audio chunks...")
-        total_frames = wf.getnframes()
-        processed_frames = 0
+        # One buffer reused for every read
+        buf = bytearray(CHUNK_FRAMES * sample_width)
+        view = memoryview(buf)
+        processed_bytes = 0
         
         while True:
-            data = wf.readframes(4000)  # Read 4000 frames at a time
-            if len(data) == 0:
+            n = readinto(buf)
+            if not n:
                 break
+            self._check_cancelled()
             
-            processed_frames += 4000
-            if progress_callback and total_frames > 0:
-                progress = min(processed_frames / total_frames * 100, 100)
-                progress_callback(f"Transcribing audio... {progress:.1f}%")
+            processed_bytes += n
+            if progress_callback:
+                progress_callback(*self._progress_message(processed_bytes, total_bytes, sample_rate * sample_width))
             
-            if rec.AcceptWaveform(data):
+            # VOSK's binding takes bytes, so only the filled slice is copied
+            if rec.AcceptWaveform(bytes(view[:n])):
                 # Process complete phrase
-                result = json.loads(rec.Result())
-                if result.get('text'):
-                    results.append(result)
+                result = _parse_result(rec.Result())
+                if result:
+                    yield result
         
         # Get final result
-        final_result = json.loads(rec.FinalResult())
-        if final_result.get('text'):
-            results.append(final_result)
+        final_result = _parse_result(rec.FinalResult())
+        if final_result:
+            yield final_result
+    
+    def _transcribe_voiced(self, readinto, sample_rate, total_bytes, progress_callback=None):
+        """Recognize only the voiced segments of the audio on worker processes, yielding segments in order."""
+        bytes_per_second = sample_rate * 2
+        batches = _batch_segments(_voiced_segments(readinto, sample_rate), sample_rate)
+        
+        def batch_end(batch):
+            offset, pcm = batch[-1]
+            return offset * bytes_per_second + len(pcm)
+        
+        if self.workers == 1:
+            print("Processing voiced audio segments...")
+            for batch in batches:
+                self._check_cancelled()
+                yield from _transcribe_segments(self.vosk_model_path, batch, sample_rate)
+                if progress_callback:
+                    progress_callback(*self._progress_message(batch_end(batch), total_bytes, bytes_per_second))
+            return
         
-        wf.close()
-        print(f"Transcription completed. Found {len(results)} segments.")
-        return results
+        print(f"Processing voiced audio segments on {self.workers} workers...")
+        pending = deque()
+        
+        def collect():
+            future, end_bytes = pending.popleft()
+            # Also wake on cancel(), rather than waiting out a running batch
+            wait((future, self._cancel_signal), return_when=FIRST_COMPLETED)
+            self._check_cancelled()
+            yield from future.result()
+            if progress_callback:
+                progress_callback(*self._progress_message(end_bytes, total_bytes, bytes_per_second))
+        
+        # The pool outlives this call, so its workers load the model only once
+        executor = self._get_executor()
+        try:
+            for batch in batches:
+                future = executor.submit(_transcribe_segments, self.vosk_model_path, batch, sample_rate)
+                pending.append((future, batch_end(batch)))
+                
+                # Keep every worker busy without buffering the whole file in memory
+                if len(pending) > self.workers * 2:
+                    yield from collect()
+            
+            while pending:
+                yield from collect()
+        finally:
+            # Stopped early: drop the batches that haven't started
+            for future, _ in pending:
+                future.cancel()
+    
+    @staticmethod
+    def _progress_message(processed_bytes, total_bytes, bytes_per_second):
+        """Return the (message, fraction) progress_callback arguments for transcription so far."""
+        if total_bytes:
+            fraction = min(processed_bytes / total_bytes, 1.0)
+            return f"Transcribing audio... {fraction * 100:.1f}%", fraction
+        return f"Transcribing audio... {processed_bytes / bytes_per_second:.1f}s processed", None
     
-    def format_timestamp(self, seconds):
+    @staticmethod
+    def format_timestamp(seconds):
         """
         Convert seconds to SRT timestamp format (HH:MM:SS,mmm).
         
@@ -183,73 +863,101 @@ class SubtitleGenerator:
         Returns:
             str: Formatted timestamp
         """
-        td = timedelta(seconds=seconds)
-        hours, remainder = divmod(td.total_seconds(), 3600)
-        minutes, seconds = divmod(remainder, 60)
-        milliseconds = int((seconds % 1) * 1000)
-        return f"{int(hours):02d}:{int(minutes):02d}:{int(seconds):02d},{milliseconds:03d}"
+        milliseconds = int(seconds * 1000 + 0.5)
+        hours, milliseconds = divmod(milliseconds, 3600_000)
+        minutes, milliseconds = divmod(milliseconds, 60_000)
+        seconds, milliseconds = divmod(milliseconds, 1000)
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
     
     def generate_srt(self, transcription_results, output_srt_path, progress_callback=None):
         """
         Generate SRT subtitle file from transcription results.
         
         Args:
-            transcription_results (list): List of transcription segments
+            transcription_results (iterable): Transcription segments, e.g. straight from transcribe_audio()
             output_srt_path (str): Path for output SRT file
             progress_callback (callable): Callback for progress updates
         """
         print(f"Generating SRT file: {output_srt_path}")
         
-        if progress_callback:
-            progress_callback("Generating subtitle file...")
+        def results():
+            yield from transcription_results
+            # Only now is transcription over; before this its progress is still coming
+            if progress_callback:
+                progress_callback("Generating subtitle file...")
+        
+        # Results are consumed lazily while writing, so a failed transcription
+        # or ffmpeg run surfaces mid-file; only a complete file replaces the target
+        tmp_path = f"{output_srt_path}.tmp"
+        try:
+            subtitle_count = self._write_srt(results(), tmp_path)
+            os.replace(tmp_path, output_srt_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        
+        print(f"SRT file generated successfully with {subtitle_count} subtitles")
+    
+    def _write_srt(self, transcription_results, srt_path):
+        """Render the transcription results into srt_path; returns the subtitle count."""
+        # Entries are rendered and written in bulk rather than line by line
+        entries = []
         
-        with open(output_srt_path, 'w', encoding='utf-8') as srt_file:
+        with open(srt_path, 'w', encoding='utf-8') as srt_file:
             subtitle_index = 1
             
             for result in transcription_results:
-                if not result.get('text'):
-                    continue
-                
-                text = result['text'].strip()
-                if not text:
-                    continue
+                if len(entries) >= SRT_FLUSH_ENTRIES:
+                    srt_file.write(_render_srt(entries, subtitle_index - len(entries)))
+                    entries.clear()
                 
                 # Handle different result formats from VOSK
-                if 'result' in result and result['result']:
-                    # Word-level timestamps available
-                    words = result['result']
+                words = result.get('result')
+                if words:
+                    # Word-level timestamps available; the joined 'text' is not needed.
+                    # Split the word dicts into parallel columns once, then work by index
+                    texts = [w['word'] for w in words]
+                    starts = [w['start'] for w in words]
+                    ends = [w['end'] for w in words]
+                    if np is not None:
+                        starts = np.asarray(starts, dtype=np.float64)
+                        ends = np.asarray(ends, dtype=np.float64)
+                        splits = np.empty(len(words), dtype=np.int64)
+                        starts_ms = np.empty(len(words), dtype=np.int64)
+                        ends_ms = np.empty(len(words), dtype=np.int64)
+                    else:
+                        splits = [0] * len(words)
+                        starts_ms = [0] * len(words)
+                        ends_ms = [0] * len(words)
                     
                     # Group words into phrases (max 10 words or 3 seconds per subtitle)
-                    current_phrase = []
-                    phrase_start = None
-                    phrase_end = None
+                    n_phrases = _group_phrases(starts, ends, splits, 10, 3.0)
+                    _ms_from_seconds(starts, starts_ms)
+                    _ms_from_seconds(ends, ends_ms)
+                    if np is not None:
+                        # Plain ints format faster than NumPy scalars
+                        starts_ms = starts_ms.tolist()
+                        ends_ms = ends_ms.tolist()
                     
-                    for word_info in words:
-                        word = word_info.get('word', '')
-                        start_time = word_info.get('start', 0)
-                        end_time = word_info.get('end', 0)
-                        
-                        if phrase_start is None:
-                            phrase_start = start_time
-                        
-                        current_phrase.append(word)
-                        phrase_end = end_time
+                    phrase_first = 0
+                    for phrase_end in splits[:n_phrases]:
+                        # Add subtitle entry
+                        entries.append((
+                            starts_ms[phrase_first],
+                            ends_ms[phrase_end - 1],
+                            ' '.join(texts[phrase_first:phrase_end])
+                        ))
                         
-                        # Create subtitle if phrase is long enough or reaches end
-                        if (len(current_phrase) >= 10 or 
-                            (phrase_end - phrase_start) >= 3.0 or 
-                            word_info == words[-1]):
-                            
-                            if current_phrase:
-                                # Write subtitle entry
-                                srt_file.write(f"{subtitle_index}\n")
-                                srt_file.write(f"{self.format_timestamp(phrase_start)} --> {self.format_timestamp(phrase_end)}\n")
-                                srt_file.write(f"{' '.join(current_phrase)}\n\n")
-                                
-                                subtitle_index += 1
-                                current_phrase = []
-                                phrase_start = None
+                        subtitle_index += 1
+                        phrase_first = phrase_end
                 else:
+                    text = result.get('text', '').strip()
+                    if not text:
+                        continue
+                    
                     # No word-level timestamps, use segment timestamps
                     start_time = result.get('start', 0)
                     end_time = result.get('end', start_time + 3)  # Default 3-second duration
@@ -267,15 +975,20 @@ class SubtitleGenerator:
                         chunk_start = start_time + (end_time - start_time) * i / len(words)
                         chunk_end = chunk_start + chunk_duration
                         
-                        srt_file.write(f"{subtitle_index}\n")
-                        srt_file.write(f"{self.format_timestamp(chunk_start)} --> {self.format_timestamp(chunk_end)}\n")
-                        srt_file.write(f"{chunk_text}\n\n")
+                        entries.append((
+                            int(chunk_start * 1000 + 0.5),
+                            int(chunk_end * 1000 + 0.5),
+                            chunk_text
+                        ))
                         
                         subtitle_index += 1
+            
+            srt_file.write(_render_srt(entries, subtitle_index - len(entries)))
         
-        print(f"SRT file generated successfully with {subtitle_index - 1} subtitles")
+        return subtitle_index - 1
     
-    def process_video(self, video_path=None, output_srt_path=None, keep_audio=False, progress_callback=None):
+    def process_video(self, video_path=None, output_srt_path=None, keep_audio=False, progress_callback=None,
+                      progress_fraction=False):
         """
         Complete pipeline: extract audio, transcribe, and generate SRT file.
         
@@ -283,19 +996,23 @@ class SubtitleGenerator:
             video_path (str): Path to input video file (optional, defaults to video folder)
             output_srt_path (str): Path for output SRT file (optional, defaults to output folder)
             keep_audio (bool): Whether to keep extracted audio file
-            progress_callback (callable): Callback for progress updates
+            progress_callback (callable): Called as progress_callback(message)
+            progress_fraction (bool): Call progress_callback(message, fraction) for
+                transcription progress instead; fraction is the share of the audio
+                transcribed (0-1), or None when the duration is unknown
         
         Returns:
             str: Path to generated SRT file
         """
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        
         # Default video path based on your structure
         if video_path is None:
-            video_dir = os.path.join(script_dir, 'video')
-            video_files = [f for f in os.listdir(video_dir) if f.endswith(('.mp4', '.avi', '.mov', '.mkv','.webm'))]
+            with os.scandir(_VIDEO_DIR) as entries:
+                video_files = sorted(
+                    e.name for e in entries
+                    if e.is_file() and os.path.splitext(e.name)[1].lower() in _VIDEO_EXTS
+                )
             if video_files:
-                video_path = os.path.join(video_dir, video_files[0])  # Use first video file found
+                video_path = str(_VIDEO_DIR / video_files[0])  # Use first video file by name
                 print(f"Using default video: {video_files[0]}")
             else:
                 raise FileNotFoundError("No video files found in video folder")
@@ -304,10 +1021,9 @@ class SubtitleGenerator:
         
         # Default output path based on your structure
         if output_srt_path is None:
-            output_dir = os.path.join(script_dir, 'output')
-            os.makedirs(output_dir, exist_ok=True)
+            _OUTPUT_DIR.mkdir(exist_ok=True)
             video_stem = Path(video_path).stem
-            output_srt_path = os.path.join(output_dir, f"{video_stem}_subtitles.srt")
+            output_srt_path = str(_OUTPUT_DIR / f"{video_stem}_subtitles.srt")
         
         print("="*50)
         print("AUTOMATIC SUBTITLE GENERATOR")
@@ -319,20 +1035,26 @@ class SubtitleGenerator:
         print("="*50)
         
         try:
-            # Step 1: Extract audio
-            audio_path = self.extract_audio(video_path, progress_callback=progress_callback)
+            # Step 1: Extract audio (only written to disk when it should be kept)
+            if keep_audio:
+                self._duration = None  # The WAV header carries the length
+                audio_source = self.extract_audio(video_path, progress_callback=progress_callback)
+            else:
+                # A pipe has no length, so probe it up front for percent progress
+                self._duration = self._probe_duration(video_path)
+                audio_source = self.open_audio_stream(video_path, progress_callback=progress_callback)
             
-            # Step 2: Transcribe audio
-            transcription_results = self.transcribe_audio(audio_path, progress_callback=progress_callback)
+            # Step 2: Transcribe audio (lazily; segments are recognized as step 3 consumes them)
+            transcription_results = self.transcribe_audio(
+                audio_source,
+                progress_callback=progress_callback,
+                duration=self._duration,
+                progress_fraction=progress_fraction
+            )
             
             # Step 3: Generate SRT file
             self.generate_srt(transcription_results, output_srt_path, progress_callback=progress_callback)
             
-            # Cleanup
-            if not keep_audio and os.path.exists(audio_path):
-                os.remove(audio_path)
-                print(f"Temporary audio file removed: {audio_path}")
-            
             print("="*50)
             print(f"SUCCESS! Subtitle file created: {output_srt_path}")
             print("="*50)
@@ -340,8 +1062,18 @@ class SubtitleGenerator:
             return output_srt_path
             
         except Exception as e:
+            if self._cancel_signal.done():
+                # Whatever broke once ffmpeg or the pool was torn down
+                print("Subtitle generation cancelled")
+                if isinstance(e, GenerationCancelled):
+                    raise
+                raise GenerationCancelled("Subtitle generation cancelled") from e
             print(f"Error processing video: {e}")
             raise
+        finally:
+            self._proc = None
+            if self._cancel_signal.done():
+                self._cancel_signal = Future()  # The next run starts uncancelled
 
 
 def main():
@@ -354,15 +1086,19 @@ def main():
                        help="Language for speech recognition (en=English, hi=Hindi)")
     parser.add_argument("--keep-audio", action="store_true", help="Keep extracted audio file")
     parser.add_argument("--custom-model", action="store_true", help="Use custom model path")
+    parser.add_argument("-j", "--workers", type=int,
+                       help=f"Number of parallel recognizer processes (default: CPU count, at most {DEFAULT_MAX_WORKERS})")
     
     args = parser.parse_args()
     
+    generator = None
     try:
         # Initialize subtitle generator
         generator = SubtitleGenerator(
             vosk_model_path=args.model, 
             language=args.language,
-            custom_model=args.custom_model
+            custom_model=args.custom_model,
+            workers=args.workers
         )
         
         # Process video
@@ -378,7 +1114,11 @@ def main():
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
+    finally:
+        if generator is not None:
+            generator.close()
 
 
 if __name__ == "__main__":
+    freeze_support()
     main()
\ No newline at end of file
@@ -12,15 +12,15 @@ echo.
 echo 🔍 Checking Python installation...
 where python >nul 2>&1 || (
     echo ❌ ERROR: Python not found in PATH
-    echo Please install Python 3.8+ from:
+    echo Please install Python 3.9+ from:
     echo https://www.python.org/downloads/
     pause
     exit /b 1
 )
 
 REM 2. Verify Python version
-python -c "import sys; exit(0 if sys.version_info >= (3, 8) else 1)" || (
-    echo ❌ ERROR: Python 3.8 or higher required
+python -c "import sys; exit(0 if sys.version_info >= (3, 9) else 1)" || (
+    echo ❌ ERROR: Python 3.9 or higher required
     python --version
     pause
     exit /b 1
@@ -77,17 +77,24 @@ pip install -r requirements.txt || (
 REM 6. Build executable
 echo.
 echo 🔨 Building executable...
+REM ffprobe.exe is optional; it only enables percent progress while transcribing
+set "FFPROBE_BINARY="
+if exist "ffprobe.exe" set "FFPROBE_BINARY=--add-binary ffprobe.exe;."
+
 python -m PyInstaller ^
   --onefile ^
   --windowed ^
   --name SubtitleGenerator ^
   --add-binary "ffmpeg.exe;." ^
+  !FFPROBE_BINARY! ^
   --add-data "models;models" ^
   --add-data "video;video" ^
   --hidden-import="customtkinter" ^
   --hidden-import="PIL._tkinter_finder" ^
   --hidden-import="vosk" ^
   --hidden-import="soundfile" ^
+  --hidden-import="webrtcvad" ^
+  --hidden-import="orjson" ^
   --collect-all customtkinter ^
   --collect-all vosk ^
   --clean ^
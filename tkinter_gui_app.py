@@ -4,38 +4,148 @@ Modern Desktop GUI Application for Automatic Subtitle Generator
 Built with CustomTkinter for a modern, responsive design
 """
 
-import customtkinter as ctk
-from tkinter import filedialog, messagebox
-import os
-import threading
-from pathlib import Path
 import sys
-import webbrowser
-from PIL import Image, ImageTk
 
-# Import your subtitle generator class
 try:
-    from app import SubtitleGenerator
+    import customtkinter as ctk
 except ImportError:
-    def show_import_error():
-        root = ctk.CTk()
-        root.withdraw()
-        messagebox.showerror("Import Error", 
-                           "Could not import SubtitleGenerator from app.py\n"
-                           "Make sure app.py is in the same directory as this GUI script.")
-        sys.exit(1)
-    show_import_error()
+    # Plain Tk is enough to tell the user what's missing
+    import tkinter as tk
+    from tkinter import messagebox
+    root = tk.Tk()
+    root.withdraw()
+    messagebox.showerror(
+        "Missing Dependency",
+        "CustomTkinter is not installed.\n\n"
+        "Please install it using:\n"
+        "pip install customtkinter"
+    )
+    sys.exit(1)
+from tkinter import TclError, filedialog, messagebox
+import _tkinter
+import asyncio
+import os
+import queue
+import subprocess
+import threading
+from collections import deque
+from multiprocessing import freeze_support
+from pathlib import Path
+from PIL import Image, ImageDraw, ImageFont
 
 # Configure CustomTkinter
 ctk.set_appearance_mode("dark")  # Modes: "System" (standard), "Dark", "Light"
 ctk.set_default_color_theme("blue")  # Themes: "blue" (standard), "green", "dark-blue"
 
+# Design size of the main window, in CTk (unscaled) pixels
+WINDOW_WIDTH = 1000
+WINDOW_HEIGHT = 700
+
+# Project folders (video/, output/) live next to this script
+_SCRIPT_DIR = Path(__file__).resolve().parent
+_VIDEO_DIR = _SCRIPT_DIR / 'video'
+_OUTPUT_DIR = _SCRIPT_DIR / 'output'
+
+# Lines kept in the log textbox; older ones are trimmed once it passes
+# LOG_MAX_LINES + LOG_TRIM_SLACK so the trim doesn't run on every insert
+LOG_MAX_LINES = 2000
+LOG_TRIM_SLACK = 200
+
+# Progress reports a run is assumed to take when the video's length is
+# unknown; the bar then creeps towards 90% with the number of reports
+PROGRESS_ESTIMATED_CALLS = 200
+
+# Least time between two progress redraws while reports stream in (seconds)
+PROGRESS_MIN_INTERVAL = 0.05
+
+# Model loads faster than this (ms), e.g. one app.py still has in memory,
+# finish without the loading dialog flashing up
+LOADING_DIALOG_DELAY_MS = 150
+
+async def _run_tk(root, interval=0.01):
+    """Drive Tk from asyncio in place of root.mainloop().
+    
+    Handles every pending Tk event, then yields to the event loop so tasks
+    such as generate_subtitles run on the same thread as the widgets.
+    """
+    root.update()  # CTk shows the window on its first update()/mainloop()
+    try:
+        while root.winfo_exists():
+            while root.tk.dooneevent(_tkinter.DONT_WAIT) > 0:
+                pass
+            await asyncio.sleep(interval)
+    except TclError:
+        pass  # root was destroyed
+
+
+def _import_generator():
+    """Import app.py's SubtitleGenerator (pulls in vosk, numpy, numba...)"""
+    from app import SubtitleGenerator
+    return SubtitleGenerator
+
+
+def _open_url(url):
+    """Open a credits/help link; webbrowser is only imported on first click"""
+    import webbrowser
+    webbrowser.open(url)
+
+
+# Title banner text; drawn once by _render_title_image
+_TITLE_EMOJI = "🎬"
+_TITLE_TEXT = " Subtitle Generator"
+_SUBTITLE_TEXT = "Generate accurate subtitles from videos using Vosk speech recognition"
+
+
+def _render_title_image(scale=2):
+    """Draw the static title and subtitle into one CTkImage.
+    
+    Rendered at `scale`x for HiDPI displays. Returns None when the Segoe UI
+    fonts aren't available so the caller can fall back to plain labels.
+    """
+    try:
+        emoji_font = ImageFont.truetype("seguiemj.ttf", 28 * scale)
+        title_font = ImageFont.truetype("seguisb.ttf", 28 * scale)
+        subtitle_font = ImageFont.truetype("segoeui.ttf", 14 * scale)
+    except OSError:
+        return None
+    
+    emoji_w = emoji_font.getlength(_TITLE_EMOJI)
+    title_w = emoji_w + title_font.getlength(_TITLE_TEXT)
+    subtitle_w = subtitle_font.getlength(_SUBTITLE_TEXT)
+    title_ascent, title_descent = title_font.getmetrics()
+    subtitle_ascent, subtitle_descent = subtitle_font.getmetrics()
+    subtitle_top = title_ascent + title_descent + 2 * scale
+    width = int(max(title_w, subtitle_w)) + scale
+    height = subtitle_top + subtitle_ascent + subtitle_descent
+    
+    # (light, dark) variants in the same colors the labels used
+    images = []
+    for title_color, subtitle_color in (("#2b2b2b", "#555555"), ("#f0f0f0", "#cccccc")):
+        image = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+        x = (width - title_w) / 2
+        draw.text((x, title_ascent), _TITLE_EMOJI, font=emoji_font, anchor="ls", embedded_color=True)
+        draw.text((x + emoji_w, title_ascent), _TITLE_TEXT, font=title_font, anchor="ls", fill=title_color)
+        draw.text(((width - subtitle_w) / 2, subtitle_top), _SUBTITLE_TEXT, font=subtitle_font, fill=subtitle_color)
+        images.append(image)
+    
+    return ctk.CTkImage(light_image=images[0], dark_image=images[1],
+                        size=(width // scale, height // scale))
+
+
+# Extensions picked up when auto-selecting a video from the video folder
+_VIDEO_EXTS = frozenset({'.mp4', '.avi', '.mov', '.mkv', '.flv', '.wmv', '.webm'})
+
 
 class ModernSubtitleGeneratorGUI:
+    # Completion messages
+    _ERR_TMPL = "Failed to generate subtitles:\n{err}"
+    _OK_TMPL = "✅ Subtitles generated: {name}"
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Subtitle Generator - Unimax Studios")
-        self.root.geometry("1000x700")
+        self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
         self.root.minsize(800, 600)
         
         # Variables
@@ -45,17 +155,75 @@ class ModernSubtitleGeneratorGUI:
         self.language = ctk.StringVar(value="en")
         self.custom_model_path = ctk.StringVar()
         self.keep_audio = ctk.BooleanVar()
-        self.processing = False
+        self._process_task = None  # asyncio.Task running generate_subtitles
+        self._preload_task = None  # asyncio.Task running preload_model
         
         # Initialize subtitle generator
         self.generator = None
+        self._SubtitleGenerator = None  # Set once app.py finishes importing
+        self._load_cancel = None  # threading.Event of the model load in flight
+        self._load_task = None  # asyncio.Task running _load_model_async
+        self._loading_dialog = None
+        self._loading_dialog_after_id = None  # Pending delayed _show_loading_dialog call
+        self._reload_after_id = None  # Pending debounced load_model call
+        self._last_model_key = None  # Selection the current/pending model load is for
+        self._log_queue = deque()  # Lines waiting for the next _drain_log pass
+        self._log_drain_pending = False
+        self._log_lines = 0  # Lines currently in log_text, tracked to skip index queries
+        self._progress_q = queue.Queue()  # Messages from the processing thread
+        self._progress_pending = False  # A _drain_progress call is scheduled
+        self._last_progress_drain = 0.0  # Loop time of the last _drain_progress
+        self._progress_drain_handle = None  # Deferred _drain_progress, see _schedule_progress_drain
+        self._loop = None  # asyncio loop driving Tk, for waking it from the worker
+        self._last_pct = 0  # Whole percent last drawn on progress_bar
+        self._progress_calls = 0  # Reports without a fraction this run
+        self._exact_progress = False  # SubtitleGenerator has reported a real fraction
+        self._fonts = {}  # Shared CTkFont instances, see _f
         
         # Set up the GUI
         self.setup_gui()
         
-        # Load default model
+        # main() schedules preload_model once the window is up; the generator
+        # (vosk and friends) is imported and the default model loaded then
+        self._set_status(text="Initializing...")
+    
+    def _f(self, **kw):
+        """Return a shared CTkFont for this spec, creating it on first use"""
+        key = tuple(sorted(kw.items()))
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = ctk.CTkFont(**kw)
+        return font
+    
+    def start_preload(self):
+        """Start preload_model on the asyncio loop that drives Tk"""
+        self._preload_task = asyncio.create_task(self.preload_model())
+    
+    async def preload_model(self):
+        """Import SubtitleGenerator in a thread, then load the selected model"""
+        try:
+            self._SubtitleGenerator = await asyncio.to_thread(_import_generator)
+        except Exception as e:
+            # Not just ImportError: a missing DLL raises OSError and a stale
+            # Numba cache can raise almost anything
+            self._show_import_error(f"{type(e).__name__}: {e}")
+            return
+        
         self.load_model()
     
+    def close(self):
+        """Shut down the recognizer processes of every loaded model"""
+        if self._SubtitleGenerator is not None:
+            self._SubtitleGenerator.shutdown_worker_pools()
+    
+    def _show_import_error(self, error):
+        """Report a failed app.py import and quit"""
+        messagebox.showerror("Import Error", 
+                           "Could not import SubtitleGenerator from app.py\n"
+                           "Make sure app.py is in the same directory as this GUI script.\n\n"
+                           f"{error}")
+        self.root.destroy()
+    
     def setup_gui(self):
         """Set up the modern GUI layout"""
         # Main container
@@ -91,23 +259,30 @@ class ModernSubtitleGeneratorGUI:
         title_frame = ctk.CTkFrame(self.main_container, fg_color="transparent")
         title_frame.pack(fill="x", pady=(0, 10))  # Reduced outer padding
         
-        # App Title
-        title_label = ctk.CTkLabel(
-            title_frame, 
-            text="🎬 Subtitle Generator",
-            font=ctk.CTkFont(family="Segoe UI Semibold", size=28, weight="bold"),
-            text_color=("#2b2b2b", "#f0f0f0")
-        )
-        title_label.pack(pady=(5, 0))  # Reduced top padding
-        
-        # Subtitle
-        subtitle_label = ctk.CTkLabel(
-            title_frame,
-            text="Generate accurate subtitles from videos using Vosk speech recognition",
-            font=ctk.CTkFont(family="Segoe UI", size=14),
-            text_color=("#555555", "#cccccc")
-        )
-        subtitle_label.pack(pady=(2, 5))  # Reduced padding below subtitle
+        # Title and subtitle are static: one pre-rendered image instead of two
+        # font-resolved labels re-laid out on every resize
+        banner = _render_title_image()
+        if banner is not None:
+            banner_label = ctk.CTkLabel(title_frame, image=banner, text="")
+            banner_label.pack(pady=(5, 5))
+        else:
+            # App Title
+            title_label = ctk.CTkLabel(
+                title_frame, 
+                text=_TITLE_EMOJI + _TITLE_TEXT,
+                font=self._f(family="Segoe UI Semibold", size=28, weight="bold"),
+                text_color=("#2b2b2b", "#f0f0f0")
+            )
+            title_label.pack(pady=(5, 0))  # Reduced top padding
+            
+            # Subtitle
+            subtitle_label = ctk.CTkLabel(
+                title_frame,
+                text=_SUBTITLE_TEXT,
+                font=self._f(family="Segoe UI", size=14),
+                text_color=("#555555", "#cccccc")
+            )
+            subtitle_label.pack(pady=(2, 5))  # Reduced padding below subtitle
         
         # Credits frame
         credits_frame = ctk.CTkFrame(
@@ -129,7 +304,7 @@ class ModernSubtitleGeneratorGUI:
         made_label = ctk.CTkLabel(
             credits_line,
             text="Made with ❤️ by ",
-            font=ctk.CTkFont(family="Segoe UI", size=12),
+            font=self._f(family="Segoe UI", size=12),
             text_color=("#666666", "#aaaaaa")
         )
         made_label.pack(side="left", padx=(0, 0))
@@ -137,17 +312,17 @@ class ModernSubtitleGeneratorGUI:
         manan_link = ctk.CTkLabel(
             credits_line,
             text="@manan_ae",
-            font=ctk.CTkFont(family="Segoe UI Semibold", size=12, underline=True),
+            font=self._f(family="Segoe UI Semibold", size=12, underline=True),
             text_color=("#1E90FF", "#00BFFF"),
             cursor="hand2"
         )
         manan_link.pack(side="left", padx=(0, 0))
-        manan_link.bind("<Button-1>", lambda e: webbrowser.open("https://instagram.com/manan_ae"))
+        manan_link.bind("<Button-1>", lambda e: _open_url("https://instagram.com/manan_ae"))
         
         separator = ctk.CTkLabel(
             credits_line,
             text=" • ",
-            font=ctk.CTkFont(family="Segoe UI", size=12),
+            font=self._f(family="Segoe UI", size=12),
             text_color=("#888888", "#777777")
         )
         separator.pack(side="left", padx=(5, 5))
@@ -155,7 +330,7 @@ class ModernSubtitleGeneratorGUI:
         powered_label = ctk.CTkLabel(
             credits_line,
             text="Powered by ",
-            font=ctk.CTkFont(family="Segoe UI", size=12),
+            font=self._f(family="Segoe UI", size=12),
             text_color=("#666666", "#aaaaaa")
         )
         powered_label.pack(side="left", padx=(0, 0))
@@ -163,12 +338,12 @@ class ModernSubtitleGeneratorGUI:
         studio_link = ctk.CTkLabel(
             credits_line,
             text="Unimax Studios",
-            font=ctk.CTkFont(family="Segoe UI Semibold", size=12, underline=True),
+            font=self._f(family="Segoe UI Semibold", size=12, underline=True),
             text_color=("#1E90FF", "#00BFFF"),
             cursor="hand2"
         )
         studio_link.pack(side="left", padx=(0, 0))
-        studio_link.bind("<Button-1>", lambda e: webbrowser.open("https://instagram.com/unimax.studios"))        
+        studio_link.bind("<Button-1>", lambda e: _open_url("https://instagram.com/unimax.studios"))        
     
     def create_input_section(self):
         """Create video input section"""
@@ -176,7 +351,7 @@ class ModernSubtitleGeneratorGUI:
         input_frame.pack(fill="x", pady=(0, 15))
         
         # Video File Selection
-        video_label = ctk.CTkLabel(input_frame, text="Video File:", font=ctk.CTkFont(size=14, weight="bold"))
+        video_label = ctk.CTkLabel(input_frame, text="Video File:", font=self._f(size=14, weight="bold"))
         video_label.grid(row=0, column=0, sticky="w", padx=20, pady=(15, 5))
         
         video_entry_frame = ctk.CTkFrame(input_frame, fg_color="transparent")
@@ -201,7 +376,7 @@ class ModernSubtitleGeneratorGUI:
         browse_video_btn.grid(row=0, column=1)
         
         # Output File Selection
-        output_label = ctk.CTkLabel(input_frame, text="Output SRT File:", font=ctk.CTkFont(size=14, weight="bold"))
+        output_label = ctk.CTkLabel(input_frame, text="Output SRT File:", font=self._f(size=14, weight="bold"))
         output_label.grid(row=2, column=0, sticky="w", padx=20, pady=(10, 5))
         
         output_entry_frame = ctk.CTkFrame(input_frame, fg_color="transparent")
@@ -235,7 +410,7 @@ class ModernSubtitleGeneratorGUI:
         model_label = ctk.CTkLabel(
             model_frame, 
             text="Speech Recognition Model:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._f(size=14, weight="bold")
         )
         model_label.pack(anchor="w", padx=20, pady=(15, 10))
         
@@ -274,6 +449,7 @@ class ModernSubtitleGeneratorGUI:
             command=self.on_language_change
         )
         hindi_radio.grid(row=0, column=1)
+        self._language_radios = (english_radio, hindi_radio)
         
         # Custom Model Radio Button
         custom_radio = ctk.CTkRadioButton(
@@ -313,7 +489,7 @@ class ModernSubtitleGeneratorGUI:
         model_info = ctk.CTkLabel(
             model_frame,
             text="Download more models from: ",
-            font=ctk.CTkFont(size=12),
+            font=self._f(size=12),
             text_color="white"
         )
         model_info.pack(anchor="w", padx=20, pady=(5, 0))
@@ -321,12 +497,12 @@ class ModernSubtitleGeneratorGUI:
         link_label = ctk.CTkLabel(
             model_frame,
             text="https://alphacephei.com/vosk/models",
-            font=ctk.CTkFont(size=12, underline=True),
+            font=self._f(size=12, underline=True),
             text_color="#00BFFF",  # light blue
             cursor="hand2"
         )
         link_label.pack(anchor="w", padx=20, pady=(0, 15))
-        link_label.bind("<Button-1>", lambda e: webbrowser.open("https://alphacephei.com/vosk/models"))
+        link_label.bind("<Button-1>", lambda e: _open_url("https://alphacephei.com/vosk/models"))
     
     def create_options_section(self):
         """Create options section"""
@@ -336,7 +512,7 @@ class ModernSubtitleGeneratorGUI:
         options_label = ctk.CTkLabel(
             options_frame,
             text="Options:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._f(size=14, weight="bold")
         )
         options_label.pack(anchor="w", padx=20, pady=(15, 10))
         
@@ -361,10 +537,11 @@ class ModernSubtitleGeneratorGUI:
             text="Generate Subtitles",
             width=200,
             height=45,
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self._f(size=16, weight="bold"),
             command=self.start_processing
         )
         self.generate_btn.grid(row=0, column=0, padx=10)
+        self._set_btn = self.generate_btn.configure
         
         clear_btn = ctk.CTkButton(
             button_container,
@@ -400,9 +577,45 @@ class ModernSubtitleGeneratorGUI:
         self.status_label = ctk.CTkLabel(
             progress_frame,
             text="Ready",
-            font=ctk.CTkFont(size=12)
+            font=self._f(size=12)
         )
         self.status_label.pack()
+        
+        # Inline prompt shown after a successful run (packed by _finalize)
+        self.result_banner = ctk.CTkFrame(
+            progress_frame,
+            fg_color=("#f0f0f0", "#2b2b2b"),
+            corner_radius=8
+        )
+        
+        self.result_label = ctk.CTkLabel(
+            self.result_banner,
+            text="",
+            font=self._f(size=12)
+        )
+        self.result_label.pack(side="left", padx=(15, 10), pady=8)
+        
+        dismiss_btn = ctk.CTkButton(
+            self.result_banner,
+            text="Dismiss",
+            width=90,
+            fg_color="gray40",
+            hover_color="gray50",
+            command=self.result_banner.pack_forget
+        )
+        dismiss_btn.pack(side="right", padx=(5, 15), pady=8)
+        
+        open_result_btn = ctk.CTkButton(
+            self.result_banner,
+            text="Open Folder",
+            width=110,
+            command=self._open_result_folder
+        )
+        open_result_btn.pack(side="right", padx=5, pady=8)
+        
+        # Bound once; these run on every progress update
+        self._set_progress = self.progress_bar.set
+        self._set_status = self.status_label.configure
     
     def create_log_section(self):
         """Create log section"""
@@ -412,34 +625,47 @@ class ModernSubtitleGeneratorGUI:
         log_label = ctk.CTkLabel(
             log_frame,
             text="Processing Log:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._f(size=14, weight="bold")
         )
         log_label.pack(anchor="w", padx=20, pady=(15, 10))
         
         self.log_text = ctk.CTkTextbox(
             log_frame,
             height=150,
-            font=ctk.CTkFont(family="Consolas", size=12)
+            font=self._f(family="Consolas", size=12)
         )
         self.log_text.pack(fill="both", expand=True, padx=20, pady=(0, 15))
     
     def set_default_paths(self):
         """Set default paths based on project structure"""
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        
         # Try to find video file in video folder
-        video_dir = os.path.join(script_dir, 'video')
-        if os.path.exists(video_dir):
-            video_files = [f for f in os.listdir(video_dir) 
-                          if f.lower().endswith(('.mp4', '.avi', '.mov', '.mkv', '.flv', '.wmv','.webm'))]
-            if video_files:
-                self.video_path.set(os.path.join(video_dir, video_files[0]))
+        if _VIDEO_DIR.exists():
+            # Stop at the first video instead of listing the whole folder
+            with os.scandir(_VIDEO_DIR) as it:
+                for e in it:
+                    if e.is_file() and os.path.splitext(e.name)[1].lower() in _VIDEO_EXTS:
+                        self.video_path.set(e.path)
+                        break
         
         # Set default output path
-        output_dir = os.path.join(script_dir, 'output')
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir, exist_ok=True)
-        self.output_path.set(os.path.join(output_dir, "subtitles.srt"))
+        _OUTPUT_DIR.mkdir(exist_ok=True)
+        self.output_path.set(str(_OUTPUT_DIR / "subtitles.srt"))
+    
+    def _model_key(self):
+        """Return the (model_type, language, custom_path) selection key"""
+        return (self.model_type.get(), self.language.get(), self.custom_model_path.get())
+    
+    def _selection_unchanged(self):
+        """True if the radios still match the model that is loaded or loading"""
+        if self._model_key() != self._last_model_key:
+            return False
+        # Clicked back to the current selection: drop any pending reload
+        if self._reload_after_id:
+            self.root.after_cancel(self._reload_after_id)
+            self._reload_after_id = None
+            if self._load_cancel is None and not self.processing:
+                self._set_btn(state="normal")
+        return True
     
     def on_model_type_change(self):
         """Handle model type change"""
@@ -447,22 +673,33 @@ class ModernSubtitleGeneratorGUI:
             self.custom_model_entry.configure(state="normal")
             self.browse_model_btn.configure(state="normal")
             self.language_frame.configure(fg_color="gray20")
-            for widget in self.language_frame.winfo_children():
-                widget.configure(state="disabled")
+            for radio in self._language_radios:
+                radio.configure(state="disabled")
         else:
             self.custom_model_entry.configure(state="disabled")
             self.browse_model_btn.configure(state="disabled")
             self.language_frame.configure(fg_color="transparent")
-            for widget in self.language_frame.winfo_children():
-                widget.configure(state="normal")
+            for radio in self._language_radios:
+                radio.configure(state="normal")
         
-        if not self.processing:
-            self.load_model()
+        # The widgets above always follow the radio; only the reload is skipped
+        if not self.processing and not self._selection_unchanged():
+            self._schedule_model_reload()
     
     def on_language_change(self):
         """Handle language change"""
-        if not self.processing and self.model_type.get() == "default":
-            self.load_model()
+        if (not self.processing and self.model_type.get() == "default"
+                and not self._selection_unchanged()):
+            self._schedule_model_reload()
+    
+    def _schedule_model_reload(self, delay=250):
+        """Debounce radio toggles so only the final selection loads a model"""
+        if self._reload_after_id:
+            self.root.after_cancel(self._reload_after_id)
+        self._reload_after_id = self.root.after(delay, self.load_model)
+        # Until the final selection's model is in, Generate would run on the
+        # previous one; load_model re-enables it
+        self._set_btn(state="disabled")
     
     def browse_video(self):
         """Browse for video file"""
@@ -470,9 +707,11 @@ class ModernSubtitleGeneratorGUI:
             ("Video files", "*.mp4 *.avi *.mov *.mkv *.flv *.wmv"),
             ("All files", "*.*")
         ]
+        # Start in the small project folders rather than a possibly huge home dir
         filename = filedialog.askopenfilename(
             title="Select Video File",
-            filetypes=filetypes
+            filetypes=filetypes,
+            initialdir=str(_VIDEO_DIR if _VIDEO_DIR.is_dir() else _SCRIPT_DIR)
         )
         if filename:
             self.video_path.set(filename)
@@ -486,7 +725,8 @@ class ModernSubtitleGeneratorGUI:
         filename = filedialog.asksaveasfilename(
             title="Save Subtitle File As",
             defaultextension=".srt",
-            filetypes=[("SRT files", "*.srt"), ("All files", "*.*")]
+            filetypes=[("SRT files", "*.srt"), ("All files", "*.*")],
+            initialdir=str(_OUTPUT_DIR)
         )
         if filename:
             self.output_path.set(filename)
@@ -508,6 +748,8 @@ class ModernSubtitleGeneratorGUI:
             self.output_path.set("")
             self.custom_model_path.set("")
             self.keep_audio.set(False)
+            self._log_queue.clear()
+            self._log_lines = 0
             self.log_text.delete("1.0", "end")
             self.set_default_paths()
     
@@ -517,178 +759,283 @@ class ModernSubtitleGeneratorGUI:
         if output_file and os.path.exists(output_file):
             folder = os.path.dirname(output_file)
         else:
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            folder = os.path.join(script_dir, 'output')
+            folder = str(_OUTPUT_DIR)
         
         if os.path.exists(folder):
             if sys.platform == "win32":
                 os.startfile(folder)
-            elif sys.platform == "darwin":
-                os.system(f"open '{folder}'")
             else:
-                os.system(f"xdg-open '{folder}'")
+                # Popen returns immediately instead of waiting on the file manager
+                opener = "open" if sys.platform == "darwin" else "xdg-open"
+                try:
+                    subprocess.Popen([opener, folder])
+                except FileNotFoundError:
+                    self.log_message(f"Could not open folder: {opener} not found")
     
     def log_message(self, message):
         """Add message to log area"""
-        self.log_text.insert("end", f"{message}\n")
-        self.log_text.see("end")
-        self.root.update_idletasks()
+        # Appended here, written out in batches by _drain_log
+        self._log_queue.append(f"{message}\n")
+        self._schedule_log_drain()
+    
+    def _schedule_log_drain(self):
+        """Flush the log queue within 50 ms, unless a flush is already due"""
+        if not self._log_drain_pending:
+            self._log_drain_pending = True
+            self.root.after(50, self._drain_log)
+    
+    def _drain_log(self):
+        """Flush queued log lines into the textbox in a single insert"""
+        self._log_drain_pending = False
+        if self._log_queue:
+            # Only the UI thread appends to the log queue, so join + clear is safe
+            chunk = "".join(self._log_queue)
+            self._log_queue.clear()
+            self.log_text.insert("end", chunk)
+            self._log_lines += chunk.count("\n")
+            if self._log_lines > LOG_MAX_LINES + LOG_TRIM_SLACK:
+                self.log_text.delete("1.0", f"{self._log_lines - LOG_MAX_LINES + 1}.0")
+                self._log_lines = LOG_MAX_LINES
+            self.log_text.see("end")
     
     def load_model(self):
         """Load VOSK model based on selection with enhanced UI feedback"""
-        try:
-            self.log_message("Loading model...")
-            self.status_label.configure(text="Loading model...")
-            
-            # Create a temporary loading dialog with credits
-            loading_dialog = ctk.CTkToplevel(self.root)
-            loading_dialog.title("Loading Model")
-            loading_dialog.geometry("400x200")
-            loading_dialog.transient(self.root)
-            loading_dialog.grab_set()
-            
-            # Center the dialog
-            loading_dialog.update_idletasks()
-            x = (loading_dialog.winfo_screenwidth() // 2) - (400 // 2)
-            y = (loading_dialog.winfo_screenheight() // 2) - (200 // 2)
-            loading_dialog.geometry(f"400x200+{x}+{y}")
-            
-            # Main container
-            main_frame = ctk.CTkFrame(loading_dialog, fg_color="#2b2b2b", corner_radius=12)
-            main_frame.pack(fill="both", expand=True, padx=20, pady=20)
-            
-            # Loading content
-            loading_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
-            loading_frame.pack(expand=True, fill="both")
-            
-            # Loading spinner/text
-            loading_label = ctk.CTkLabel(
-                loading_frame,
-                text="🔄 Loading Model...",
-                font=ctk.CTkFont(family="Segoe UI", size=16, weight="bold"),
-                text_color="#00BFFF"
-            )
-            loading_label.pack(pady=(20, 10))
-            
-            # Progress indicator
-            progress_bar = ctk.CTkProgressBar(loading_frame, width=300, progress_color="#00BFFF")
-            progress_bar.pack(pady=10)
-            progress_bar.set(0.5)  # Indeterminate progress
-            
-            # Credits section (beautifully integrated)
-            credits_frame = ctk.CTkFrame(
-                loading_frame,
-                fg_color="#1e1e1e",
-                corner_radius=8,
-                height=60
-            )
-            credits_frame.pack(fill="x", pady=(20, 10))
-            credits_frame.pack_propagate(False)
-            
-            # Credits container
-            credits_container = ctk.CTkFrame(credits_frame, fg_color="transparent")
-            credits_container.pack(expand=True)
-            
-            # Single line credits
-            credits_line = ctk.CTkFrame(credits_container, fg_color="transparent")
-            credits_line.pack()
-            
-            made_label = ctk.CTkLabel(
-                credits_line,
-                text="Made with ❤️ by ",
-                font=ctk.CTkFont(family="Segoe UI", size=12),
-                text_color="#b0b0b0"
-            )
-            made_label.pack(side="left")
-            
-            manan_link = ctk.CTkLabel(
-                credits_line,
-                text="@manan_ae",
-                font=ctk.CTkFont(family="Segoe UI", size=12, weight="bold", underline=True),
-                text_color="#00BFFF",
-                cursor="hand2"
-            )
-            manan_link.pack(side="left")
-            manan_link.bind("<Button-1>", lambda e: webbrowser.open("https://instagram.com/manan_ae"))
-            
-            separator = ctk.CTkLabel(
-                credits_line,
-                text=" • ",
-                font=ctk.CTkFont(family="Segoe UI", size=12),
-                text_color="#707070"
-            )
-            separator.pack(side="left")
-            
-            powered_label = ctk.CTkLabel(
-                credits_line,
-                text="Powered by ",
-                font=ctk.CTkFont(family="Segoe UI", size=12),
-                text_color="#b0b0b0"
+        self._reload_after_id = None
+        if self.processing:
+            # The run holds self.generator; _finalize reloads once it's done
+            return
+        if self._SubtitleGenerator is None:
+            # Still importing; preload_model loads the current selection when done
+            self._set_btn(state="normal")
+            return
+        
+        # Snapshot the selection here; the worker thread must not read Tk variables
+        model_type = self.model_type.get()
+        language = self.language.get()
+        model_path = self.custom_model_path.get()
+        
+        if model_type == "custom" and not model_path:
+            self.log_message("Please select a custom model path")
+            self._set_status(text="No custom model selected")
+            self._set_btn(state="normal")
+            return
+        
+        self._last_model_key = (model_type, language, model_path)
+        
+        # A newer selection supersedes any load still in flight
+        if self._load_cancel is not None:
+            self._load_cancel.set()
+            self._load_cancel = None
+        
+        cancel = threading.Event()
+        self._load_cancel = cancel
+        
+        self.log_message("Loading model...")
+        self._set_status(text="Loading model...")
+        # Generating is blocked by disabling the button until the load is done
+        self._set_btn(state="disabled")
+        
+        # app.py keeps recently used models loaded, so switching back to one
+        # is quick; only a slow load brings up the dialog
+        if self._loading_dialog_after_id is None:
+            self._loading_dialog_after_id = self.root.after(
+                LOADING_DIALOG_DELAY_MS, self._show_loading_dialog, model_type
             )
-            powered_label.pack(side="left")
-            
-            studio_link = ctk.CTkLabel(
-                credits_line,
-                text="Unimax Studios",
-                font=ctk.CTkFont(family="Segoe UI", size=12, weight="bold", underline=True),
-                text_color="#00BFFF",
-                cursor="hand2"
+        
+        # Actual model loading runs off the UI thread; the task resumes on it
+        self._load_task = asyncio.create_task(
+            self._load_model_async(model_type, language, model_path, cancel)
+        )
+    
+    def _show_loading_dialog(self, model_type):
+        """Show the (reused) loading dialog for a load still in flight"""
+        self._loading_dialog_after_id = None
+        loading_dialog = self._get_loading_dialog()
+        # No grab: the dialog stays transient over the main window
+        loading_dialog.deiconify()
+        
+        # Update progress
+        self._loading_progress.set(0.8)
+        if model_type == "custom":
+            self._loading_label.configure(text="🔄 Loading Custom Model...")
+        else:
+            self._loading_label.configure(text="🔄 Loading Default Model...")
+    
+    def _get_loading_dialog(self):
+        """Return the model loading dialog, building it on first use"""
+        if self._loading_dialog is not None:
+            return self._loading_dialog
+        
+        # Create the loading dialog with credits
+        loading_dialog = ctk.CTkToplevel(self.root)
+        loading_dialog.title("Loading Model")
+        loading_dialog.geometry("400x200")
+        loading_dialog.transient(self.root)
+        # Closing it only hides it so the next load can show it again
+        loading_dialog.protocol("WM_DELETE_WINDOW", loading_dialog.withdraw)
+        
+        # Center the dialog
+        loading_dialog.update_idletasks()
+        x = (loading_dialog.winfo_screenwidth() // 2) - (400 // 2)
+        y = (loading_dialog.winfo_screenheight() // 2) - (200 // 2)
+        loading_dialog.geometry(f"400x200+{x}+{y}")
+        
+        # Main container
+        main_frame = ctk.CTkFrame(loading_dialog, fg_color="#2b2b2b", corner_radius=12)
+        main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        
+        # Loading content
+        loading_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        loading_frame.pack(expand=True, fill="both")
+        
+        # Loading spinner/text
+        loading_label = ctk.CTkLabel(
+            loading_frame,
+            text="🔄 Loading Model...",
+            font=self._f(family="Segoe UI", size=16, weight="bold"),
+            text_color="#00BFFF"
+        )
+        loading_label.pack(pady=(20, 10))
+        
+        # Progress indicator
+        progress_bar = ctk.CTkProgressBar(loading_frame, width=300, progress_color="#00BFFF")
+        progress_bar.pack(pady=10)
+        progress_bar.set(0.5)  # Indeterminate progress
+        
+        # Credits section (beautifully integrated)
+        credits_frame = ctk.CTkFrame(
+            loading_frame,
+            fg_color="#1e1e1e",
+            corner_radius=8,
+            height=60
+        )
+        credits_frame.pack(fill="x", pady=(20, 10))
+        credits_frame.pack_propagate(False)
+        
+        # Credits container
+        credits_container = ctk.CTkFrame(credits_frame, fg_color="transparent")
+        credits_container.pack(expand=True)
+        
+        # Single line credits
+        credits_line = ctk.CTkFrame(credits_container, fg_color="transparent")
+        credits_line.pack()
+        
+        made_label = ctk.CTkLabel(
+            credits_line,
+            text="Made with ❤️ by ",
+            font=self._f(family="Segoe UI", size=12),
+            text_color="#b0b0b0"
+        )
+        made_label.pack(side="left")
+        
+        manan_link = ctk.CTkLabel(
+            credits_line,
+            text="@manan_ae",
+            font=self._f(family="Segoe UI", size=12, weight="bold", underline=True),
+            text_color="#00BFFF",
+            cursor="hand2"
+        )
+        manan_link.pack(side="left")
+        manan_link.bind("<Button-1>", lambda e: _open_url("https://instagram.com/manan_ae"))
+        
+        separator = ctk.CTkLabel(
+            credits_line,
+            text=" • ",
+            font=self._f(family="Segoe UI", size=12),
+            text_color="#707070"
+        )
+        separator.pack(side="left")
+        
+        powered_label = ctk.CTkLabel(
+            credits_line,
+            text="Powered by ",
+            font=self._f(family="Segoe UI", size=12),
+            text_color="#b0b0b0"
+        )
+        powered_label.pack(side="left")
+        
+        studio_link = ctk.CTkLabel(
+            credits_line,
+            text="Unimax Studios",
+            font=self._f(family="Segoe UI", size=12, weight="bold", underline=True),
+            text_color="#00BFFF",
+            cursor="hand2"
+        )
+        studio_link.pack(side="left")
+        studio_link.bind("<Button-1>", lambda e: _open_url("https://instagram.com/unimax.studios"))
+        
+        self._loading_dialog = loading_dialog
+        self._loading_progress = progress_bar
+        self._loading_label = loading_label
+        return loading_dialog
+    
+    def _hide_loading_dialog(self):
+        """Withdraw the loading dialog, keeping it for the next load"""
+        if self._loading_dialog_after_id is not None:
+            self.root.after_cancel(self._loading_dialog_after_id)
+            self._loading_dialog_after_id = None
+        if self._loading_dialog is not None:
+            self._loading_dialog.withdraw()
+        if not self.processing:
+            self._set_btn(state="normal")
+    
+    def _construct_generator(self, model_type, language, model_path):
+        """Construct the SubtitleGenerator; runs in a worker thread"""
+        if model_type == "custom":
+            return self._SubtitleGenerator(
+                vosk_model_path=model_path,
+                custom_model=True
             )
-            studio_link.pack(side="left")
-            studio_link.bind("<Button-1>", lambda e: webbrowser.open("https://instagram.com/unimax.studios"))
-            
-            # Update the dialog
-            loading_dialog.update()
-            
-            # Actual model loading logic
-            if self.model_type.get() == "custom":
-                model_path = self.custom_model_path.get()
-                if not model_path:
-                    loading_dialog.destroy()
-                    self.log_message("Please select a custom model path")
-                    self.status_label.configure(text="No custom model selected")
-                    return
-                
-                # Update progress
-                progress_bar.set(0.8)
-                loading_label.configure(text="🔄 Loading Custom Model...")
-                loading_dialog.update()
-                
-                self.generator = SubtitleGenerator(
-                    vosk_model_path=model_path,
-                    custom_model=True
-                )
-                self.log_message(f"Custom model loaded: {os.path.basename(model_path)}")
-            else:
-                # Update progress
-                progress_bar.set(0.8)
-                loading_label.configure(text="🔄 Loading Default Model...")
-                loading_dialog.update()
-                
-                self.generator = SubtitleGenerator(language=self.language.get())
-                model_name = "Hindi" if self.language.get() == "hi" else "English"
-                self.log_message(f"Default {model_name} model loaded")
-            
-            # Complete loading
-            progress_bar.set(1.0)
-            loading_label.configure(text="✅ Model Loaded Successfully!", text_color="#00BFFF")
-            loading_dialog.update()
-            
-            # Brief pause to show completion
-            loading_dialog.after(1000, loading_dialog.destroy)
-            
-            self.status_label.configure(text="Ready - Model loaded")
-            
+        return self._SubtitleGenerator(language=language)
+    
+    async def _load_model_async(self, model_type, language, model_path, cancel):
+        """Load the model in a thread, then apply the result on the UI thread"""
+        generator = None
+        error = None
+        try:
+            generator = await asyncio.to_thread(self._construct_generator, model_type, language, model_path)
         except Exception as e:
-            # Close loading dialog if it exists
-            try:
-                loading_dialog.destroy()
-            except:
-                pass
-                
-            self.log_message(f"Error loading model: {str(e)}")
-            self.status_label.configure(text="Error - Model not loaded")
-            messagebox.showerror("Model Error", f"Failed to load VOSK model:\n{str(e)}")
+            error = str(e)
+        
+        # Back on the UI thread here; Tk can't be called from the worker
+        # because the loop runs Tk via dooneevent, not mainloop()
+        self._finish_load_model(generator, error, model_type, language, model_path, cancel)
+    
+    def _finish_load_model(self, generator, error, model_type, language, model_path, cancel):
+        """Apply a finished model load on the UI thread"""
+        if cancel.is_set():
+            # A newer selection is loading; this result is stale
+            return
+        
+        self._load_cancel = None
+        
+        if error:
+            self._last_model_key = None  # Let the same selection retry
+            self._hide_loading_dialog()
+            self.log_message(f"Error loading model: {error}")
+            self._set_status(text="Error - Model not loaded")
+            messagebox.showerror("Model Error", f"Failed to load VOSK model:\n{error}")
+            return
+        
+        # The old model's recognizer pool keeps running in app.py, so switching
+        # back to it doesn't reload the model in every worker
+        self.generator = generator
+        if model_type == "custom":
+            self.log_message(f"Custom model loaded: {os.path.basename(model_path)}")
+        else:
+            model_name = "Hindi" if language == "hi" else "English"
+            self.log_message(f"Default {model_name} model loaded")
+        
+        # Complete loading; flash the result on the status bar instead of
+        # holding the dialog open
+        self._hide_loading_dialog()
+        self._set_status(text="✅ Model Loaded Successfully!")
+        self.root.after(1500, self._reset_loaded_status)
+    
+    def _reset_loaded_status(self):
+        """Replace the model-loaded flash unless the status moved on"""
+        if self.status_label.cget("text") == "✅ Model Loaded Successfully!":
+            self._set_status(text="Ready - Model loaded")
     
     def validate_inputs(self):
         """Validate user inputs"""
@@ -723,30 +1070,45 @@ class ModernSubtitleGeneratorGUI:
             return
         
         # Start processing
-        self.processing = True
-        self.generate_btn.configure(text="Processing...", state="disabled")
-        self.progress_bar.set(0)
-        self.progress_bar.start()
-        self.status_label.configure(text="Processing video...")
+        self._set_btn(text="Processing...", state="disabled")
+        self.result_banner.pack_forget()
+        if not self.progress_bar.winfo_manager():
+            # Hidden after a failed run
+            self.progress_bar.pack(pady=5, before=self.status_label)
+        self._set_progress(0)
+        self._last_pct = 0
+        self._progress_calls = 0
+        self._exact_progress = False
+        self._set_status(text="Processing video...")
         
         # Clear log
+        self._log_queue.clear()
+        self._log_lines = 0
         self.log_text.delete("1.0", "end")
         
-        # Start processing thread
-        thread = threading.Thread(target=self.process_video)
-        thread.daemon = True
-        thread.start()
+        # Runs on the asyncio loop that drives Tk (see _run_tk)
+        self._loop = asyncio.get_running_loop()
+        self._process_task = asyncio.create_task(self.generate_subtitles())
     
-    def update_progress(self, message):
-        """Update progress from thread"""
-        self.root.after(0, lambda: self.status_label.configure(text=message))
-        self.root.after(0, lambda: self.log_message(message))
+    @property
+    def processing(self):
+        """True while a generate_subtitles task is running"""
+        return self._process_task is not None
     
-    def process_video(self):
-        """Process video in background thread"""
+    async def generate_subtitles(self):
+        """Generate subtitles, awaiting the blocking transcription in a thread"""
+        # Read the Tk variables here, on the UI thread
+        video_path = self.video_path.get()
+        output_path = self.output_path.get()
+        generator = self.generator
+        # Split once; the completion dialog reuses it
+        self._out_basename = os.path.basename(output_path)
+        
+        result_path = None
+        error = None
         try:
             self.update_progress("Starting subtitle generation...")
-            self.update_progress(f"Video: {os.path.basename(self.video_path.get())}")
+            self.update_progress(f"Video: {os.path.basename(video_path)}")
             
             if self.model_type.get() == "custom":
                 self.update_progress(f"Using custom model: {os.path.basename(self.custom_model_path.get())}")
@@ -755,90 +1117,215 @@ class ModernSubtitleGeneratorGUI:
                 self.update_progress(f"Using default {model_name} model")
             
             # Create output directory if it doesn't exist
-            output_dir = os.path.dirname(self.output_path.get())
+            output_dir = os.path.dirname(output_path)
             os.makedirs(output_dir, exist_ok=True)
             
             # Process the video with progress callback
-            result_path = self.generator.process_video(
-                video_path=self.video_path.get(),
-                output_srt_path=self.output_path.get(),
+            result_path = await asyncio.to_thread(
+                generator.process_video,
+                video_path=video_path,
+                output_srt_path=output_path,
                 keep_audio=self.keep_audio.get(),
-                progress_callback=self.update_progress
+                progress_callback=self.update_progress,
+                progress_fraction=True
             )
-            
-            # Success
-            self.root.after(0, self.processing_complete, result_path, None)
-            
+        except asyncio.CancelledError:
+            # The worker thread can't be interrupted directly; cancel() kills
+            # ffmpeg and the recognizer pool so it returns promptly, otherwise
+            # asyncio.run() would sit waiting for it on exit
+            generator.cancel()
+            raise
         except Exception as e:
-            # Error
-            self.root.after(0, self.processing_complete, None, str(e))
+            error = str(e)
+        
+        self._process_task = None
+        await self.processing_complete(result_path, error)
+    
+    def update_progress(self, message, fraction=None):
+        """Update progress from thread"""
+        if fraction is not None:
+            self._exact_progress = True
+        elif not self._exact_progress:
+            # No duration to measure against; estimate from the report count
+            self._progress_calls += 1
+            fraction = min(0.9, self._progress_calls / PROGRESS_ESTIMATED_CALLS)
+        # Picked up by _drain_progress on the UI thread
+        self._progress_q.put((message, fraction))
+        if not self._progress_pending:
+            self._progress_pending = True
+            # Hand the drain straight to the loop when there is something to
+            # show instead of polling the queue on a timer
+            self._loop.call_soon_threadsafe(self._schedule_progress_drain)
+    
+    def _schedule_progress_drain(self):
+        """Drain progress now, or once PROGRESS_MIN_INTERVAL has passed since the last drain"""
+        delay = self._last_progress_drain + PROGRESS_MIN_INTERVAL - self._loop.time()
+        if delay > 0:
+            self._progress_drain_handle = self._loop.call_later(delay, self._drain_progress)
+        else:
+            self._drain_progress()
     
-    def processing_complete(self, result_path, error):
+    def _drain_progress(self, max_messages=64):
+        """Apply queued progress messages: log them all, show the latest"""
+        # Cleared before draining, so a message put from now on schedules
+        # another pass
+        self._progress_pending = False
+        self._last_progress_drain = self._loop.time()
+        messages = []
+        try:
+            while len(messages) < max_messages:
+                messages.append(self._progress_q.get_nowait())
+        except queue.Empty:
+            pass
+        if messages:
+            self._set_status(text=messages[-1][0])
+            self._log_queue.extend(f"{m}\n" for m, _ in messages)
+            self._schedule_log_drain()
+            # The bar only repaints when the whole percent actually moves
+            fractions = [f for _, f in messages if f is not None]
+            if fractions:
+                pct = int(fractions[-1] * 100)
+                if pct != self._last_pct:
+                    self._last_pct = pct
+                    self._set_progress(fractions[-1])
+        if len(messages) == max_messages and not self._progress_pending:
+            # Backlog left over; come back for the rest
+            self._progress_pending = True
+            self._progress_drain_handle = self._loop.call_later(PROGRESS_MIN_INTERVAL, self._drain_progress)
+    
+    async def processing_complete(self, result_path, error):
         """Handle completion of processing"""
-        self.processing = False
-        self.progress_bar.stop()
-        self.progress_bar.set(100 if not error else 0)
-        self.generate_btn.configure(text="Generate Subtitles", state="normal")
+        # Apply every widget update in one idle callback so Tk redraws once,
+        # and only then bring up the error dialog
+        finalized = asyncio.get_running_loop().create_future()
+        self.root.after_idle(self._finalize, result_path, error, finalized)
+        await finalized
+        
+        if error:
+            self.show_error("Processing Error", self._ERR_TMPL.format(err=error))
+    
+    def _finalize(self, result_path, error, finalized):
+        """Reset the progress widgets after a run; resolves `finalized` when done"""
+        # Apply what the run reported before the final state, not after it:
+        # a deferred drain would otherwise overwrite the status and log
+        while not self._progress_q.empty():
+            self._drain_progress()
+        if self._progress_drain_handle is not None:
+            self._progress_drain_handle.cancel()
+            self._progress_drain_handle = None
+        self._progress_pending = False
+        
+        if error:
+            # Unmapping is cheaper than a zero-set canvas redraw; start_processing
+            # packs the bar again
+            self.progress_bar.pack_forget()
+        else:
+            self._set_progress(1)
+        self._set_btn(text="Generate Subtitles", state="normal")
+        if self._model_key() != self._last_model_key:
+            # The radios moved while the run held the model
+            self._schedule_model_reload()
         
         if error:
             self.log_message(f"Error: {error}")
-            self.status_label.configure(text="Error occurred")
-            messagebox.showerror("Processing Error", f"Failed to generate subtitles:\n{error}")
+            self._set_status(text="Error occurred")
         else:
             self.log_message(f"Success! Subtitle file created: {result_path}")
-            self.status_label.configure(text="Completed successfully")
+            self._set_status(text="Completed successfully")
             
-            # Show success dialog
-            result = messagebox.askyesno(
-                "Success", 
-                f"Subtitles generated successfully!\n\nFile: {os.path.basename(result_path)}\n\nWould you like to open the output folder?",
-                icon="question"
+            # Offer to open the folder inline rather than in a native dialog
+            self.result_label.configure(text=self._OK_TMPL.format(name=self._out_basename))
+            self.result_banner.pack(fill="x", padx=20, pady=(8, 0))
+        
+        finalized.set_result(None)
+    
+    def _open_dialog(self, title, message, buttons):
+        """Show a CTkToplevel message dialog without nesting a Tk event loop.
+        
+        `buttons` is a sequence of (text, value) pairs; the returned Future
+        resolves with the clicked button's value (the last one if the window
+        is closed).
+        """
+        future = asyncio.get_running_loop().create_future()
+        dialog = ctk.CTkToplevel(self.root)
+        dialog.title(title)
+        dialog.transient(self.root)
+        dialog.resizable(False, False)
+        
+        def close(value):
+            if not future.done():
+                future.set_result(value)
+            dialog.destroy()
+        
+        dialog.protocol("WM_DELETE_WINDOW", lambda: close(buttons[-1][1]))
+        
+        message_label = ctk.CTkLabel(
+            dialog,
+            text=message,
+            font=self._f(size=13),
+            justify="left",
+            wraplength=360
+        )
+        message_label.pack(padx=20, pady=(20, 10))
+        
+        button_row = ctk.CTkFrame(dialog, fg_color="transparent")
+        button_row.pack(pady=(0, 15))
+        for text, value in buttons:
+            button = ctk.CTkButton(
+                button_row,
+                text=text,
+                width=90,
+                command=lambda v=value: close(v)
             )
-            if result:
-                self.open_output_folder()
+            button.pack(side="left", padx=5)
+        
+        return future
+    
+    def _open_result_folder(self):
+        """Open the output folder from the result banner and dismiss it"""
+        self.result_banner.pack_forget()
+        self.open_output_folder()
+    
+    def show_error(self, title, message):
+        """Show an error dialog without waiting for it to be dismissed"""
+        self._open_dialog(title, message, (("OK", None),))
     
     
 def main():
     """Main function to run the GUI application"""
-    # Check if customtkinter is installed
-    try:
-        import customtkinter
-    except ImportError:
-        root = ctk.CTk()
-        root.withdraw()
-        messagebox.showerror(
-            "Missing Dependency",
-            "CustomTkinter is not installed.\n\n"
-            "Please install it using:\n"
-            "pip install customtkinter"
-        )
-        sys.exit(1)
-    
     # Create and run the application
     root = ctk.CTk()
     app = ModernSubtitleGeneratorGUI(root)
     
-    # Center the window
-    root.update_idletasks()
-    width = root.winfo_width()
-    height = root.winfo_height()
-    x = (root.winfo_screenwidth() // 2) - (width // 2)
-    y = (root.winfo_screenheight() // 2) - (height // 2)
-    root.geometry(f"{width}x{height}+{x}+{y}")
+    # Center the window from its design size; no layout pass needed to
+    # measure it. CTk scales the size but not the +x+y offset.
+    scaling = ctk.ScalingTracker.get_window_scaling(root)
+    # Both screen dimensions in one Tcl round-trip
+    screen_w, screen_h = map(int, root.tk.eval("list [winfo screenwidth .] [winfo screenheight .]").split())
+    x = (screen_w - round(WINDOW_WIDTH * scaling)) // 2
+    y = (screen_h - round(WINDOW_HEIGHT * scaling)) // 2
+    root.geometry(f"+{x}+{y}")
+    
+    # Warm up the generator and model once the first frame is on screen,
+    # so the heavy imports don't compete with building and painting the UI
+    root.after(50, app.start_preload)
     
     # Handle window closing
     def on_closing():
-        if app.processing:
-            if messagebox.askokcancel("Quit", "Processing is in progress. Do you want to quit anyway?"):
-                root.destroy()
-        else:
-            root.destroy()
+        task = app._process_task
+        if task is not None and not task.done():
+            if not messagebox.askokcancel("Quit", "Processing is in progress. Do you want to quit anyway?"):
+                return
+            task.cancel()
+        app.close()
+        root.destroy()
     
     root.protocol("WM_DELETE_WINDOW", on_closing)
     
-    # Start the GUI event loop
-    root.mainloop()
+    # Start the GUI event loop, driven by asyncio
+    asyncio.run(_run_tk(root))
 
 
 if __name__ == "__main__":
+    freeze_support()  # Transcription worker processes re-enter the frozen exe
     main()
\ No newline at end of file